@@ -1,31 +1,80 @@
-import configparser
+import atexit
+import importlib
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
 import click
 
-from src.cli.commands.pull_request_commands import pull_requests
 from src.cli.errors import ErrorHandlingGroup, configure_error_handling
 
-logging.getLogger("oci").setLevel(logging.CRITICAL)
 log = logging.getLogger(__name__)
 
-def load_config() -> configparser.ConfigParser:
-    config = configparser.ConfigParser()
-    config.read("config.ini")
-    return config
+_LOG_FORMAT = '%(asctime)s %(levelname)s [%(filename)s:%(lineno)d] - %(message)s'
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+class LazyGroup(ErrorHandlingGroup):
+    """Click group that defers importing subcommand modules until first use.
+
+    Importing a command module eagerly drags in its whole dependency chain
+    (services, OCI SDK, etc.), which is pure overhead for `--help` or
+    unrelated invocations. Subcommands listed in `lazy_subcommands` are
+    imported only when Click actually resolves them.
+    """
+
+    def __init__(self, *args,
+                 lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 def setup_logging(debug: bool) -> None:
-    handler = logging.StreamHandler(sys.stdout) if debug else logging.FileHandler(Path("app.log"))
+    # Only meaningful once the OCI SDK is imported, so set it here rather
+    # than at module import time.
+    logging.getLogger("oci").setLevel(logging.CRITICAL)
+
+    if logging.getLogger().hasHandlers():
+        # Already configured (e.g. nested invocation); don't rebuild handlers.
+        return
+
+    if debug:
+        # Developers want to see output immediately, so keep stdout unbuffered.
+        handler = logging.StreamHandler(sys.stdout)
+    else:
+        # Buffer file writes in memory so we do one write syscall per batch
+        # instead of one per record. delay=True avoids opening the log file
+        # until the first record is actually flushed.
+        target = logging.FileHandler(Path("app.log"), delay=True)
+        handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=target,
+            flushOnClose=True,
+        )
+        atexit.register(handler.flush)
     logging.basicConfig(
         level=logging.DEBUG,
-        format='%(asctime)s %(levelname)s [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt="%Y-%m-%d %H:%M:%S",
+        format=_LOG_FORMAT,
+        datefmt=_LOG_DATEFMT,
         handlers=[handler]
     )
 
-@click.group(cls=ErrorHandlingGroup, context_settings={"allow_interspersed_args": True})
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"pull-requests": ("src.cli.commands.pull_request_commands", "pull_requests")},
+    context_settings={"allow_interspersed_args": True},
+)
 @click.option("--debug", is_flag=True)
 @click.pass_context
 def cli(ctx: click.Context, debug: bool) -> None:
@@ -45,4 +94,10 @@ def cli(ctx: click.Context, debug: bool) -> None:
     configure_error_handling(debug)
 
 
-cli.add_command(pull_requests)
+@cli.command()
+def daemon() -> None:
+    """Keep OCI clients warm in a resident process to speed up repeat calls."""
+    from src.cli import daemon as daemon_server
+
+    click.echo(f"Listening on {daemon_server.SOCKET_PATH} (Ctrl-C to stop)")
+    daemon_server.serve()
@@ -2,9 +2,8 @@
 from typing import Literal
 
 import click
-from tabulate import tabulate
 
-from src.services.pull_requests.service import PullRequestService
+_CREATED_AT_FORMAT = "%Y-%m-%d %H:%M"
 
 
 @click.group()
@@ -13,16 +12,48 @@ def pull_requests() -> None:
     pass
 
 
+def _format_table(headers: list[str], rows: list[list[str]]) -> str:
+    """Render a small fixed-width table.
+
+    The list output is a handful of rows in four columns; computing column
+    widths and left-justifying is all that is needed, without paying the
+    import and per-row formatting cost of tabulate.
+    """
+    widths = [
+        max(len(header), *(len(row[i]) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+
+    def format_row(values: list[str]) -> str:
+        cells = (value.ljust(width) for value, width in zip(values, widths, strict=True))
+        return "| " + " | ".join(cells) + " |"
+
+    lines = [separator, format_row(headers), separator]
+    lines.extend(format_row(row) for row in rows)
+    lines.append(separator)
+    return "\n".join(lines)
+
+
 @pull_requests.command()
 @click.argument("repos", nargs=-1)
 @click.option("--status", type=click.Choice(["open"]), default="open")
 @click.option("--limit", type=int, default=10)
 def list(repos: tuple[str, ...], status: Literal["open"], limit: int) -> None:
     """List pull requests for a repository."""
-    service = PullRequestService()
+    from src.cli import daemon
+
     kwargs = {"status": status, "limit": limit}
-    pull_requests = service.list_pull_requests(
-        repos, **kwargs)
+    try:
+        # A running daemon already holds a warm service and OCI client.
+        pull_requests = daemon.dispatch("list_pull_requests", repos, **kwargs)
+    except daemon.DaemonUnavailableError:
+        # Imported here so that `--help` and argument validation never pay for
+        # the service layer and its transitive OCI SDK import.
+        from src.services.pull_requests.service import PullRequestService
+
+        service = PullRequestService()
+        pull_requests = service.list_pull_requests(repos, **kwargs)
 
     if pull_requests:
         headers = ["Title", "Status", "Created", "Changes"]
@@ -30,11 +61,12 @@ def list(repos: tuple[str, ...], status: Literal["open"], limit: int) -> None:
             [
                 pr.title,
                 pr.status,
-                pr.created_at.strftime("%Y-%m-%d %H:%M"),
+                pr.created_at.strftime(_CREATED_AT_FORMAT),
                 f"{pr.total_changes} (+{pr.lines_added}/-{pr.lines_deleted})"
             ]
             for pr in pull_requests
         ]
-        click.echo(tabulate(data, headers=headers, tablefmt="pretty"))
+        # Single echo: one stdout resolution and one write for the whole table.
+        click.echo(_format_table(headers, data))
     else:
         click.echo("No pull requests found.")
@@ -0,0 +1,123 @@
+"""Process-resident daemon that keeps OCI clients warm between invocations.
+
+Python, Click and OCI SDK startup dominates the latency of short CLI calls
+made in tight loops (scripts, CI). Running ``tasks daemon`` keeps a
+PullRequestService — with its signed OCI client — live in a background
+process listening on a Unix domain socket. Subsequent CLI invocations detect
+the socket and dispatch over it, paying a socket round trip instead of a
+cold start. When no daemon is running, callers fall back to in-process
+execution.
+"""
+
+import logging
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.pull_requests.service import PullRequestService
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH = Path.home() / ".tasks-cli.sock"
+
+
+class DaemonUnavailableError(Exception):
+    """Raised when no daemon is listening on the socket."""
+
+
+def serve(socket_path: Path = SOCKET_PATH) -> None:
+    """Run the daemon loop until interrupted.
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+    """
+    # Imported here so the daemon module itself stays cheap to import.
+    from src.services.pull_requests.service import PullRequestService
+
+    service = PullRequestService()
+    socket_path.unlink(missing_ok=True)
+
+    with Listener(str(socket_path), "AF_UNIX") as listener:
+        logger.info("Daemon listening on %s", socket_path)
+        try:
+            while True:
+                with listener.accept() as conn:
+                    _handle_connection(service, conn)
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def _is_auth_failure(error: Exception) -> bool:
+    """Check whether an error was caused by rejected OCI credentials."""
+    original = getattr(error, "original_error", None)
+    return (
+        getattr(original, "status", None) == 401
+        or getattr(original, "code", None) == "NotAuthenticated"
+    )
+
+
+def _reset_auth_state(service: "PullRequestService") -> None:
+    """Drop cached OCI credentials so the next request rebuilds a fresh signer.
+
+    The session token expires well within a realistic daemon lifetime.
+    Without this reset the cached signer keeps failing every dispatched call
+    — even after the user re-authenticates — until the daemon is restarted.
+    After the reset, the next request re-reads the token and either succeeds
+    or surfaces the re-auth UserError with its fix instructions.
+    """
+    from src.clients.oci.base import reset_auth_caches
+
+    logger.info("Authentication failure; resetting cached OCI credentials")
+    reset_auth_caches()
+    service.devops_client.reset_client()
+
+
+def _handle_connection(service: "PullRequestService", conn: Connection) -> None:
+    """Serve one request: receive (method, args, kwargs), send (status, payload)."""
+    try:
+        method, args, kwargs = conn.recv()
+    except EOFError:
+        return
+
+    try:
+        result = getattr(service, method)(*args, **kwargs)
+        conn.send(("ok", result))
+    except Exception as e:
+        logger.debug("Daemon request %s failed", method, exc_info=True)
+        if _is_auth_failure(e):
+            _reset_auth_state(service)
+        try:
+            conn.send(("error", e))
+        except Exception:
+            # The original exception may not pickle; send a plain stand-in.
+            conn.send(("error", RuntimeError(str(e))))
+
+
+def dispatch(method: str, *args, **kwargs) -> Any:  # noqa: ANN401 - returns whatever the service does
+    """Invoke a PullRequestService method via a running daemon.
+
+    Args:
+        method: Name of the PullRequestService method to invoke
+
+    Returns:
+        Whatever the service method returned, unpickled
+
+    Raises:
+        DaemonUnavailableError: When no daemon is listening or it went away
+            mid-exchange, so callers can fall back to in-process execution
+    """
+    if not SOCKET_PATH.exists():
+        raise DaemonUnavailableError(f"no daemon socket at {SOCKET_PATH}")
+
+    try:
+        with Client(str(SOCKET_PATH), "AF_UNIX") as conn:
+            conn.send((method, args, kwargs))
+            status, payload = conn.recv()
+    except (EOFError, OSError) as e:
+        # Covers both a missing daemon and one that died mid-exchange.
+        raise DaemonUnavailableError(str(e)) from e
+
+    if status == "error":
+        raise payload
+    return payload
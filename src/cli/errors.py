@@ -54,25 +54,89 @@ class ErrorHandlingGroup(click.Group):
 
 
 class ErrorHandlingCommand(click.Command):
-    """Custom Click Command that wraps the callback function with error handling."""
+    """Custom Click Command that applies error handling when invoked.
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        # Wrap the callback with our error handler
-        if self.callback is not None:
-            self.callback = wrap_with_error_handler(self.callback)
+    The handler is applied in invoke() rather than by wrapping the callback at
+    construction, so registering a command costs nothing until it actually runs.
+    """
+
+    def invoke(self, ctx: click.Context) -> Any:  # noqa: ANN401 - mirrors click.Command.invoke
+        try:
+            return super().invoke(ctx)
+        except (click.ClickException, click.exceptions.Exit, click.exceptions.Abort):
+            raise
+        except Exception as e:
+            _handle_exception(ctx, e)
 
 # Define type variables for the function parameters and return type
 P = ParamSpec('P')  # Represents the parameter specification of the wrapped function
 R = TypeVar('R')    # Represents the return type of the wrapped function
 
 
+@functools.lru_cache(maxsize=1)
+def _stderr_is_tty() -> bool:
+    """Check once per process whether stderr is a terminal."""
+    return click.get_text_stream("stderr").isatty()
+
+
+def _style(message: str, fg: str) -> str:
+    """Colour a message for terminal display, or pass it through untouched.
+
+    When output is piped or redirected (CI logs), ANSI escapes are just
+    noise, so skip generating them entirely.
+    """
+    if _stderr_is_tty():
+        return click.style(message, fg=fg)
+    return message
+
+
+def _handle_exception(ctx: click.Context, e: Exception) -> None:
+    """
+    Translate an application exception into a user-facing ExceptionWrapper.
+
+    Completely suppresses exception class names and tracebacks. Defined once at
+    module scope so the formatting logic is shared by ErrorHandlingCommand and
+    the standalone decorator.
+    """
+    if isinstance(e, UserError):
+        # Format the user error message
+        message = e.message
+        if getattr(e, 'fix_instructions', None):
+            message += f"\n\nTo fix this issue:\n{e.fix_instructions}"
+        # Use click's built-in exception wrapper but with our custom formatting
+        raise ExceptionWrapper(_style(message, fg='yellow')) from e
+    if isinstance(e, SystemError):
+        # Format the system error message
+        message = e.message
+        if ctx.obj and ctx.obj.get('debug', False) and e.debug_info:
+            message += f"\n\nDebug information: {e.debug_info}"
+            if e.original_error:
+                message += f"\n\nOriginal error: {str(e.original_error)}"
+        else:
+            message += "\n\nRun with --debug for more information."
+        raise ExceptionWrapper(_style(message, fg='red')) from e
+    if isinstance(e, AppError):
+        # Format the application error message
+        raise ExceptionWrapper(_style(e.message, fg='red')) from e
+
+    # Format unexpected errors
+    error_message = str(e)
+    if not ctx.obj or not ctx.obj.get('debug', False):
+        # Strip the exception class name if present (e.g., "ValueError: actual message")
+        if ': ' in error_message:
+            error_message = error_message.split(': ', 1)[1]
+        error_message += "\n\nRun with --debug for more information."
+        raise ExceptionWrapper(_style(error_message, fg='red')) from e
+    # In debug mode, let Click handle it normally to show traceback
+    raise e
+
+
 def wrap_with_error_handler(f: Callable[P, R]) -> Callable[[click.Context, Any, Any], R]:
     """
     Wrap a function with error handling logic.
 
-    Completely suppresses exception class names and tracebacks.
-    This can be used as a standalone decorator or internally by ErrorHandlingCommand.
+    Standalone decorator form for callables that do not go through
+    ErrorHandlingCommand.
     """
 
     @functools.wraps(f)
@@ -80,38 +144,10 @@ def wrap_with_error_handler(f: Callable[P, R]) -> Callable[[click.Context, Any,
     def wrapper(ctx: click.Context, *args, **kwargs) -> R:
         try:
             return ctx.invoke(f, *args, **kwargs)
-        except UserError as e:
-            # Format the user error message
-            message = e.message
-            if hasattr(e, 'fix_instructions') and e.fix_instructions:
-                message += f"\n\nTo fix this issue:\n{e.fix_instructions}"
-            # Use click's built-in exception wrapper but with our custom formatting
-            raise ExceptionWrapper(click.style(message, fg='yellow')) from e
-        except SystemError as e:
-            # Format the system error message
-            message = e.message
-            if ctx.obj and ctx.obj.get('debug', False) and e.debug_info:
-                message += f"\n\nDebug information: {e.debug_info}"
-                if e.original_error:
-                    message += f"\n\nOriginal error: {str(e.original_error)}"
-            else:
-                message += "\n\nRun with --debug for more information."
-            raise ExceptionWrapper(click.style(message, fg='red')) from e
-        except AppError as e:
-            # Format the application error message
-            raise ExceptionWrapper(click.style(e.message, fg='red')) from e
+        except (click.ClickException, click.exceptions.Exit, click.exceptions.Abort):
+            raise
         except Exception as e:
-            # Format unexpected errors
-            error_message = str(e)
-            if not ctx.obj or not ctx.obj.get('debug', False):
-                # Strip the exception class name if present (e.g., "ValueError: actual message")
-                if ': ' in error_message:
-                    error_message = error_message.split(': ', 1)[1]
-                error_message += "\n\nRun with --debug for more information."
-                raise ExceptionWrapper(click.style(error_message, fg='red')) from e
-            else:
-                # In debug mode, let Click handle it normally to show traceback
-                raise
+            _handle_exception(ctx, e)
 
     return wrapper
 
@@ -6,8 +6,10 @@ It handles authentication, configuration, and standardized error handling.
 
 import logging
 import os
+import threading
+import time
 from collections.abc import Callable
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Any, TypeVar
 
 import oci
@@ -16,13 +18,95 @@ from oci.auth.signers import SecurityTokenSigner
 from oci.util import to_dict
 
 from src.core.config import config
-from src.core.errors import SystemError, UserError
+from src.core.errors import ConfigurationError, SystemError, UserError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available.
+
+    Caps the sustained request rate so concurrent fan-outs stay under the
+    service's quota instead of triggering 429s and exponential backoff.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._rate = rate
+        # Capacity must never drop below one token or a sub-1 rate (a valid
+        # requests-per-second budget) could never satisfy acquire().
+        self._capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+@lru_cache(maxsize=8)
+def _load_oci_config_cached(profile_name: str) -> dict[str, Any]:
+    """Parse ~/.oci/config once per profile per process.
+
+    The SDK re-reads and re-parses the file on every from_file call, which is
+    redundant I/O when several clients are constructed in one run.
+    """
+    return oci.config.from_file(profile_name=profile_name)
+
+
+@lru_cache(maxsize=4)
+def _get_session_signer(token_path: str, key_file: str,
+                        pass_phrase: str | None) -> SecurityTokenSigner:
+    """Build (and reuse) a session signer for the given token/key material.
+
+    All clients in the process that share a session share one live signer,
+    so the token file read and RSA key parse happen once. Failures (missing
+    file, expired session) are not cached, so the next construction
+    re-checks from disk.
+    """
+    with open(token_path) as fh:
+        token = fh.read()
+    private_key = oci.signer.load_private_key_from_file(key_file, pass_phrase)
+
+    token_container = SecurityTokenContainer(None, token)
+
+    if not token_container.valid():
+        raise UserError(
+            "Your OCI session has expired.",
+            fix_instructions=(
+                "1. To refresh your session run: "
+                "oci session authenticate --profile <your profile name> \n"
+                "2. To validate your session run: "
+                "oci session validate --profile <your profile name>"
+            )
+        )
+
+    return SecurityTokenSigner(token, private_key)
+
+
+def reset_auth_caches() -> None:
+    """Forget the cached OCI config and session signers.
+
+    Session tokens expire within the lifetime of a long-running process (the
+    daemon); after an authentication failure this forces the next client
+    construction to re-read ~/.oci/config and the token file instead of
+    reusing a stale cached signer.
+    """
+    _load_oci_config_cached.cache_clear()
+    _get_session_signer.cache_clear()
+
+
 class OCIBaseClient:
     """Base class for OCI service clients.
 
@@ -46,14 +130,84 @@ class OCIBaseClient:
 
         # Get OCI profile configuration
         self.profile_name = profile_name or self._get_profile_name()
-        self.oci_config = self._load_oci_config()
 
-        # Get service-specific configuration
-        self.endpoint = config.get(self.service_name, "endpoint")
-        self.retry_strategy = config.get(self.service_name, "retry")
+        # Resolved operation callables, keyed by name, so hot operations
+        # skip repeated attribute lookup on the OCI client.
+        self._ops: dict[str, Callable] = {}
+
+        self._client: T | None = None
+        self._client_lock = threading.Lock()
+
+    @cached_property
+    def oci_config(self) -> dict[str, Any]:
+        """OCI configuration, loaded lazily on first access."""
+        return self._load_oci_config()
+
+    @cached_property
+    def endpoint(self) -> str | None:
+        """Service endpoint from config.ini, if configured."""
+        return config.get(self.service_name, "endpoint")
+
+    @cached_property
+    def retry_strategy(self) -> str | None:
+        """Retry strategy from config.ini, if configured."""
+        return config.get(self.service_name, "retry")
+
+    @cached_property
+    def rate_limiter(self) -> _TokenBucket | None:
+        """Token bucket built from the service's rate_limit config, if set.
 
-        # Initialize the client
-        self.client = self._create_client()
+        rate_limit is the sustained requests-per-second budget for this
+        service section in config.ini; leave it unset for no limiting.
+        """
+        rate_limit = config.get(self.service_name, "rate_limit")
+        if not rate_limit:
+            return None
+
+        try:
+            rate = float(rate_limit)
+        except ValueError:
+            rate = -1.0
+        if rate <= 0:
+            raise ConfigurationError(
+                f"Invalid rate_limit '{rate_limit}' for service '{self.service_name}'.",
+                fix_instructions=(
+                    "Set rate_limit in config.ini to a positive requests-per-second "
+                    "number, or remove the key to disable rate limiting."
+                )
+            )
+
+        return _TokenBucket(rate)
+
+    @property
+    def client(self) -> T:
+        """The OCI client, constructed lazily on first call.
+
+        Deferring construction means `--help` and argument-validation
+        failures never touch ~/.oci/config or pay for client setup. First
+        construction is guarded by a lock: cached_property does not lock, and
+        concurrent first calls from a thread fan-out would otherwise each
+        build (and mostly discard) their own client and session.
+        """
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+                client = self._client
+        return client
+
+    def reset_client(self) -> None:
+        """Discard the built client so the next call reconstructs it.
+
+        Paired with reset_auth_caches() after an authentication failure: the
+        next call() then resolves a fresh config and signer rather than the
+        stale ones captured at construction time.
+        """
+        with self._client_lock:
+            self._client = None
+            self._ops.clear()
+            self.__dict__.pop("oci_config", None)
 
     def _get_profile_name(self) -> str:
         """Get the OCI profile name from config or environment variable."""
@@ -65,7 +219,7 @@ class OCIBaseClient:
 
     def _load_oci_config(self) -> dict[str, Any]:
         """Load the OCI configuration from file."""
-        return oci.config.from_file(profile_name=self.profile_name)
+        return _load_oci_config_cached(self.profile_name)
 
     def _get_signer(self)-> SecurityTokenSigner | None:
         """Create a session signer from the config."""
@@ -77,26 +231,11 @@ class OCIBaseClient:
         expanded_token_path = os.path.expanduser(token_path)
 
         try:
-            with open(expanded_token_path) as fh:
-                token = fh.read()
-                private_key = oci.signer.load_private_key_from_file(
-                    self.oci_config.get("key_file"), self.oci_config.get("pass_phrase")
-                )
-
-            token_container = SecurityTokenContainer(None, token)
-
-            if not token_container.valid():
-                raise UserError(
-                    "Your OCI session has expired.",
-                    fix_instructions=(
-                        "1. To refresh your session run: "
-                        "oci session authenticate --profile <your profile name> \n"
-                        "2. To validate your session run: "
-                        "oci session validate --profile <your profile name>"
-                    )
-                )
-
-            return SecurityTokenSigner(token, private_key)
+            return _get_session_signer(
+                expanded_token_path,
+                self.oci_config.get("key_file"),
+                self.oci_config.get("pass_phrase"),
+            )
         except FileNotFoundError as e:
             raise UserError(
                 f"OCI security token file not found at {expanded_token_path}",
@@ -141,10 +280,23 @@ class OCIBaseClient:
         Returns:
             List of dictionaries containing the transformed data
         """
+        op = self._ops.get(operation)
+        if op is None:
+            op = self._ops[operation] = getattr(self.client, operation)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         try:
-            response = getattr(self.client, operation)(**kwargs)
-        except oci.exceptions.ServiceError:
-            raise
+            response = op(**kwargs)
+        except oci.exceptions.ServiceError as e:
+            # Translate into the AppError hierarchy here so individual
+            # commands never need their own try/except around OCI calls.
+            raise SystemError(
+                f"OCI {self.service_name} request failed: {e.message}",
+                debug_info=f"status={e.status} code={e.code} operation={operation}",
+                original_error=e
+            ) from e
         except Exception as e:
             raise SystemError(
                 "Unexpected error occurred",
@@ -155,16 +307,12 @@ class OCIBaseClient:
         if transform_func is None:
             transform_func = to_dict
 
-        data = getattr(response, response_key, [])
-
-        try:
-            result = []
-            for item in data.items:
-                result.append(transform_func(item))
-        except KeyError:
-            result = transform_func(data)
+        data = getattr(response, response_key, None)
+        items = getattr(data, "items", None)
+        if items is None:
+            return transform_func(data)
 
-        return result
+        return [transform_func(item) for item in items]
 
 
 @lru_cache(maxsize=32)
@@ -4,12 +4,59 @@ This module provides a client for interacting with the OCI DevOps service.
 It handles repository and pull request operations.
 """
 
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Any
 
 import oci.devops
 
 from src.clients.oci.base import OCIBaseClient
 
+# Cache keys are (operation, repository_id, pull_request_id); payloads are the
+# dict (or list of dicts) shapes that OCIBaseClient.call produces.
+_CacheKey = tuple[str, str, str]
+_CachedResponse = dict[str, Any] | list[dict[str, Any]]
+
+
+class _TTLCache:
+    """Small thread-safe cache whose entries expire after a fixed TTL.
+
+    Pull request metadata and diffs change rarely (diffs of merged or closed
+    pull requests never do), so short-lived reuse avoids repeat round trips
+    when several code paths ask for the same resource.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 300.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[_CacheKey, tuple[float, _CachedResponse]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _CacheKey) -> _CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: _CacheKey, value: _CachedResponse) -> None:
+        with self._lock:
+            if len(self._entries) >= self._maxsize:
+                now = time.monotonic()
+                live = {k: v for k, v in self._entries.items() if v[0] >= now}
+                # If everything is still live, drop the oldest insertions.
+                while len(live) >= self._maxsize:
+                    live.pop(next(iter(live)))
+                self._entries = live
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
 
 class DevOpsClient(OCIBaseClient):
     """Client for OCI DevOps API operations."""
@@ -20,6 +67,52 @@ class DevOpsClient(OCIBaseClient):
             service_name="devops",
             client_class=oci.devops.DevopsClient
         )
+        self._response_cache = _TTLCache()
+        self._inflight: dict[_CacheKey, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _fetch_cached(self, key: _CacheKey,
+                      fetch: Callable[[], _CachedResponse]) -> _CachedResponse:
+        """Serve from the TTL cache, coalescing concurrent identical fetches.
+
+        With fetches fanned out across threads, overlapping requests for the
+        same resource would otherwise each hit the network. The first caller
+        performs the fetch; concurrent callers for the same key wait on its
+        future and share the result.
+
+        Hits return the cache-resident object itself, not a copy, so caller
+        mutations persist across hits; keep any enrichment idempotent (the
+        summary block added by get_pull_request_diff is).
+        """
+        data = self._response_cache.get(key)
+        if data is not None:
+            return data
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result()
+
+        try:
+            data = fetch()
+        except BaseException as e:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        self._response_cache.set(key, data)
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        future.set_result(data)
+        return data
 
     def get_pull_requests(self, repository_id: str, **kwargs) -> list[dict[str, Any]]:
         """Get pull requests for a repository.
@@ -43,11 +136,12 @@ class DevOpsClient(OCIBaseClient):
         Returns:
             Pull request data dictionary
         """
-        return self.call(
+        key = ("get_pull_request", repository_id, pull_request_id)
+        return self._fetch_cached(key, lambda: self.call(
             operation="get_pull_request",
             repository_id=repository_id,
             pull_request_id=pull_request_id
-        )
+        ))
 
     def get_commit_diff(self, repository_id: str, pull_request_id: str) -> dict[str, Any]:
         """Get the diff for a pull request.
@@ -59,10 +153,20 @@ class DevOpsClient(OCIBaseClient):
         Returns:
             Dictionary with diff data and summary statistics
         """
-        diff_data = self.call(
+        key = ("get_commit_diff", repository_id, pull_request_id)
+        return self._fetch_cached(key, lambda: self.call(
             operation="get_commit_diff",
             repository_id=repository_id,
             pull_request_id=pull_request_id
-        )
+        ))
+
+
+@lru_cache(maxsize=1)
+def get_devops_client() -> DevOpsClient:
+    """Return the process-wide DevOps client.
 
-        return diff_data
+    The underlying OCI SDK client keeps a pooled requests.Session, so sharing
+    one instance reuses TCP/TLS connections across all DevOps calls instead
+    of handshaking per construction.
+    """
+    return DevOpsClient()
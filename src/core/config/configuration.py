@@ -7,6 +7,7 @@ from src import BASE_DIR
 class Configuration:
     _instance = None
     _config: configparser.ConfigParser | None = None
+    _flat: dict[tuple[str, str], str] | None = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -20,15 +21,19 @@ class Configuration:
         config_path = os.path.join(BASE_DIR, 'config.ini')
         if os.path.exists(config_path):
             self._config.read(config_path)
+        # Flatten into a plain dict so lookups are O(1) dict hits with no
+        # NoSection/NoOption exception handling on the hot path.
+        self._flat = {
+            (section, key): value
+            for section in self._config.sections()
+            for key, value in self._config.items(section)
+        }
 
     def get(self, section: str, key: str) -> str | int | bool | None:
         """Get a configuration value."""
         if self._config is None:
             self._load_config()
-        try:
-            return self._config.get(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return None
+        return self._flat.get((section, key))
 
     def get_section(self, section: str) -> dict[str, str]:
         """Get an entire configuration section as dictionary."""
@@ -1,12 +1,17 @@
 
-from dataclasses import asdict, dataclass
+import functools
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
-    """Model representing a pull request."""
+    """Model representing a pull request.
+
+    slots=True drops the per-instance __dict__, which matters when a listing
+    materializes hundreds of these.
+    """
 
     id: str
     title: str
@@ -33,12 +38,16 @@ class PullRequest:
             self.lines_deleted = summary.get('lines_deleted', 0)
             self.total_changes = summary.get('total_changes', 0)
         else:
-            files = diff_data.get('files', [])
-            self.lines_added = sum(file.get('lines_added', 0) for file in files)
-            self.lines_deleted = sum(file.get('lines_deleted', 0) for file in files)
-            self.total_changes = self.lines_added + self.lines_deleted
+            # Single pass over the file list instead of one generator per stat.
+            lines_added = lines_deleted = 0
+            for file in diff_data.get('files', []):
+                lines_added += file.get('lines_added', 0)
+                lines_deleted += file.get('lines_deleted', 0)
+            self.lines_added = lines_added
+            self.lines_deleted = lines_deleted
+            self.total_changes = lines_added + lines_deleted
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PullRequestFilter:
     status: str = "OPEN"
     limit: int = 10
@@ -46,14 +55,30 @@ class PullRequestFilter:
 
     def __post_init__(self):
         """OCI lifecycle details field uses upper case when filtering"""
-        self.status = self.status.upper()
+        object.__setattr__(self, "status", self.status.upper())
 
-    field_mapping = {
+    # ClassVar so the dataclass machinery (and asdict) never treats the
+    # mapping as an instance field.
+    field_mapping: ClassVar[dict[str, str]] = {
         "status": "lifecycle_details",
         "limit": "limit",
         "author": "created_by"
     }
 
     def to_oci(self) -> dict[str, str]:
-        result = asdict(self)
-        return {self.field_mapping[k]: v for k, v in result.items() if v is not None}
+        # Copy so callers can mutate the result without poisoning the cache.
+        return dict(_to_oci_cached(self))
+
+
+@functools.cache
+def _to_oci_cached(filter: PullRequestFilter) -> dict[str, str]:
+    """Translate a filter to OCI keyword arguments, once per filter shape.
+
+    Filters are frozen and hashable, and listing N repos reuses one filter,
+    so the translation runs once instead of once per repo.
+    """
+    return {
+        oci_key: value
+        for key, oci_key in PullRequestFilter.field_mapping.items()
+        if (value := getattr(filter, key)) is not None
+    }
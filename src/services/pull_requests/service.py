@@ -4,10 +4,12 @@ This service provides business logic for pull request operations,
 converting between OCI data models and application domain models.
 """
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
-from src.clients.oci.devops import DevOpsClient
+from src.clients.oci.devops import get_devops_client
 from src.core.config import config
 from src.models.app.pull_request import PullRequest, PullRequestFilter
 
@@ -25,7 +27,7 @@ class PullRequestService:
 
     def __init__(self) -> None:
         """Initialize the pull request service."""
-        self.devops_client = DevOpsClient()
+        self.devops_client = get_devops_client()
         self.repo_mapping = get_repo_ocid_mapping()
 
     def get_pull_requests(self, repo: str, filter: PullRequestFilter) -> list[PullRequest]:
@@ -38,10 +40,9 @@ class PullRequestService:
         Returns:
             List of PullRequest domain objects
         """
-        try:
-            repo_id = self.repo_mapping[repo]
-        except KeyError as e:
-            raise ValueError(f"Repository '{repo}' not found in configuration. ") from e
+        repo_id = self.repo_mapping.get(repo)
+        if repo_id is None:
+            raise ValueError(f"Repository '{repo}' not found in configuration. ")
 
         data = self.devops_client.get_pull_requests(repo_id, **filter.to_oci())
 
@@ -73,9 +74,11 @@ class PullRequestService:
         diff_data = self.devops_client.get_commit_diff(repository_id, pull_request_id)
 
         if diff_data and 'summary' not in diff_data:
-            files = diff_data.get('files', [])
-            lines_added = sum(file.get('lines_added', 0) for file in files)
-            lines_deleted = sum(file.get('lines_deleted', 0) for file in files)
+            # One pass over the file list instead of one generator per stat.
+            lines_added = lines_deleted = 0
+            for file in diff_data.get('files', []):
+                lines_added += file.get('lines_added', 0)
+                lines_deleted += file.get('lines_deleted', 0)
 
             diff_data['summary'] = {
                 'lines_added': lines_added,
@@ -88,19 +91,46 @@ class PullRequestService:
         filter = PullRequestFilter(**kwargs)
         all_pull_requests = []
 
+        # Membership tests up front keep exception-driven control flow (and
+        # its stack-unwind cost) out of the fetch loop entirely.
+        known_repos = [repo for repo in repos if repo in self.repo_mapping]
         for repo in repos:
-            try:
-                repo_pull_requests = self.get_pull_requests(repo, filter)
-                all_pull_requests.extend(repo_pull_requests)
-            except ValueError:
-                logger.info(f"Repository {repo} not found in config.ini")
-
-        for pull_request in all_pull_requests:
-            diff_data = self.get_pull_request_diff(pull_request.repository_name, pull_request.id)
-            pull_request.update_diff_stats(diff_data)
+            if repo not in self.repo_mapping:
+                logger.info("Repository %s not found in config.ini", repo)
+
+        if known_repos:
+            # Each fetch is a blocking HTTP round trip; overlap them so wall
+            # time is bounded by the slowest repo rather than the sum.
+            with ThreadPoolExecutor(max_workers=min(len(known_repos), 16)) as executor:
+                futures = [
+                    executor.submit(self.get_pull_requests, repo, filter)
+                    for repo in known_repos
+                ]
+                for future in as_completed(futures):
+                    all_pull_requests.extend(future.result())
+
+        if all_pull_requests:
+            # Diff retrieval is one HTTPS round trip per pull request and
+            # dominates latency for any non-trivial result set; fan out and
+            # apply the stats as each diff arrives.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(
+                        self.get_pull_request_diff, pull_request.repository_name, pull_request.id
+                    ): pull_request
+                    for pull_request in all_pull_requests
+                }
+                for future in as_completed(futures):
+                    futures[future].update_diff_stats(future.result())
 
         return all_pull_requests
 
+@functools.cache
 def get_repo_ocid_mapping() -> dict[str, str]:
-    """Returns a dictionary mapping repository names to their OCIDs."""
+    """Returns a dictionary mapping repository names to their OCIDs.
+
+    Cached so repeated service instantiations share one dict instead of
+    rebuilding it from the config section each time; use
+    get_repo_ocid_mapping.cache_clear() to force a reload.
+    """
     return dict(config.get_section("repos").items())